@@ -1,38 +1,368 @@
 # database/db_manager.py
 import sqlite3
+import threading
+import queue
+import atexit
+from concurrent.futures import Future
+from pathlib import Path
+from contextlib import contextmanager
 import pandas as pd
-import streamlit as st
-import traceback
+import logging
+import hmac
+import re
+import hashlib
+import base64
 from datetime import datetime, timedelta
 import os
+import bcrypt
+
+logger = logging.getLogger(__name__)
+
+# Size of the per-connection compiled statement cache. Connections are pooled,
+# so hot queries below are prepared once and reused on every call.
+STATEMENT_CACHE_SIZE = 256
+
+# Idle read-only connections kept open for reuse; more can be checked out
+# at once, the extras are closed when they are given back
+READER_POOL_SIZE = 8
+
+# Bump whenever init_database gains new tables, indexes or table rebuilds so
+# existing databases pick them up; stored in the file as PRAGMA user_version
+SCHEMA_VERSION = 7
+
+# bcrypt only uses this many bytes of the password; see _bcrypt_input
+BCRYPT_MAX_BYTES = 72
+# $2b$12$ followed by the 22-character salt and 31-character digest
+BCRYPT_HASH_RE = re.compile(r'\$2[abxy]\$\d{2}\$[./A-Za-z0-9]{53}')
+
+# Score fields of the nep_compliance table, in column order
+NEP_SCORE_KEYS = (
+    'multidisciplinary', 'flexible_curriculum', 'skill_integration',
+    'digital_literacy', 'research_culture', 'industry_connect'
+)
+
+# create_notification buffers rows and writes them in one batch once this
+# many are pending or the interval (seconds) has passed
+NOTIFICATION_FLUSH_ROWS = 100
+NOTIFICATION_FLUSH_INTERVAL = 0.5
+NOTIFICATION_TYPES = ('info', 'warning', 'success', 'error', 'job', 'application')
+
+# Hot point-lookup statements, kept as constants so every call passes the
+# exact same SQL text and hits the connection's statement cache
+SQL_AUTHENTICATE_USER = "SELECT * FROM users WHERE username = ? AND is_active = 1"
+SQL_STUDENT_BY_USER = "SELECT * FROM students WHERE user_id = ?"
+SQL_COLLEGE_BY_USER = "SELECT * FROM colleges WHERE user_id = ?"
+SQL_RECRUITER_BY_USER = "SELECT * FROM recruiters WHERE user_id = ?"
+SQL_GET_JOBS = '''
+    SELECT j.*, r.company_name
+    FROM jobs j
+    JOIN recruiters r ON j.recruiter_id = r.recruiter_id
+    WHERE j.is_active = 1
+'''
+
+# get_jobs filters: (filter key, SQL condition, parameter pattern)
+JOB_FILTERS = (
+    ('job_type', "j.job_type = ?", "{}"),
+    ('location', "j.location LIKE ?", "%{}%"),
+    # Indexed seek on job_skills instead of a LIKE scan of skills_required
+    ('skills', "EXISTS (SELECT 1 FROM job_skills js "
+               "WHERE js.job_id = j.job_id AND js.skill_name = ?)", "{}"),
+)
+
+SQL_CREATE_STUDENT = '''
+    INSERT INTO students (user_id, full_name, enrollment_number, college_id,
+                          department, semester, cgpa, phone, skills)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+# Skill rows derived from the comma-separated skills columns. Student skills
+# are keyed by user_id (UNIQUE on students) so bulk inserts need no ids back.
+SQL_ADD_JOB_SKILL = "INSERT OR IGNORE INTO job_skills (job_id, skill_name) VALUES (?, ?)"
+SQL_ADD_STUDENT_SKILL = (
+    "INSERT OR IGNORE INTO student_skills (student_id, skill_name) "
+    "SELECT student_id, ? FROM students WHERE user_id = ?"
+)
+SQL_CREATE_NOTIFICATION = (
+    "INSERT INTO notifications (user_id, title, message, notification_type) "
+    "VALUES (?, ?, ?, ?)"
+)
+
+# Dashboard statistics, one round trip per role. The LEFT JOINs keep a row
+# for a profile with no applications/jobs; no row means no profile.
+SQL_STUDENT_DASHBOARD = '''
+    SELECT COUNT(a.student_id) AS total,
+           SUM(a.status = 'accepted') AS accepted,
+           SUM(a.status = 'shortlisted') AS shortlisted
+    FROM students s
+    LEFT JOIN applications a ON a.student_id = s.student_id
+    WHERE s.user_id = ?
+    GROUP BY s.student_id
+'''
+SQL_RECRUITER_DASHBOARD = '''
+    SELECT COUNT(j.job_id) AS total_jobs,
+           SUM(j.is_active = 1) AS active_jobs
+    FROM recruiters r
+    LEFT JOIN jobs j ON j.recruiter_id = r.recruiter_id
+    WHERE r.user_id = ?
+    GROUP BY r.recruiter_id
+'''
+SQL_COLLEGE_DASHBOARD = '''
+    SELECT COUNT(s.student_id) AS total_students,
+           AVG(s.cgpa) AS avg_cgpa,
+           (SELECT COUNT(*) FROM placements p
+            WHERE p.college_id = c.college_id) AS total_placements
+    FROM colleges c
+    LEFT JOIN students s ON s.college_id = c.college_id
+    WHERE c.user_id = ?
+    GROUP BY c.college_id
+'''
+
+def _bcrypt_input(password):
+    """Password bytes for bcrypt, which reads at most 72 bytes (bcrypt 5
+    raises beyond that); longer passwords are pre-hashed to a 44-byte
+    base64 SHA-256 digest so every byte still counts"""
+    data = password.encode()
+    if len(data) > BCRYPT_MAX_BYTES:
+        data = base64.b64encode(hashlib.sha256(data).digest())
+    return data
+
+def hash_password(password):
+    """Hash a password for storage with bcrypt"""
+    return bcrypt.hashpw(_bcrypt_input(password), bcrypt.gensalt()).decode()
+
+def is_bcrypt_hash(password_hash):
+    """Whether a stored password_hash is a bcrypt hash (not legacy plain text)"""
+    return BCRYPT_HASH_RE.fullmatch(password_hash) is not None
+
+def verify_password(password, password_hash):
+    """Check a password against its stored hash in constant time"""
+    if is_bcrypt_hash(password_hash):
+        return bcrypt.checkpw(_bcrypt_input(password), password_hash.encode())
+    # Plain-text rows from before bcrypt was enabled
+    return hmac.compare_digest(password.encode(), password_hash.encode())
+
+def split_skills(skills):
+    """Split a comma-separated skills string into clean skill names"""
+    return [skill.strip() for skill in (skills or '').split(',') if skill.strip()]
+
+def to_hash_bytes(value):
+    """Convert a hex digest (optionally 0x-prefixed) to raw bytes for BLOB
+    hash columns"""
+    if isinstance(value, str):
+        value = bytes.fromhex(value[2:] if value[:2] in ('0x', '0X') else value)
+    return sqlite3.Binary(value)
+
+def to_hash_value(value):
+    """Like to_hash_bytes, but values that are not hex are returned as given
+    (legacy rows and non-hex transaction ids are stored as text)"""
+    try:
+        return to_hash_bytes(value) if value else value
+    except ValueError:
+        return value
 
 class DatabaseManager:
+    # journal_mode=WAL is persistent in the database file, so it only needs
+    # to be switched on once per database path per process
+    _pragmas_set = set()
+    
     def __init__(self, db_path="placement_platform.db"):
         self.db_path = db_path
-        self.init_database()
+        # Idle long-lived read-only connections, see get_connection
+        self._pool = []
+        self._pool_lock = threading.Lock()
+        # get_jobs SQL text per combination of active filters
+        self._jobs_stmts = {}
+        # Write-behind buffer of notification rows, see create_notification
+        self._notif_buf = []
+        self._notif_lock = threading.Lock()
+        self._notif_flush_lock = threading.Lock()
+        self._notif_timer = None
+        # All writes go through a single writer thread and its own connection
+        self._write_queue = queue.Queue()
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="db-writer", daemon=True
+        )
+        self._writer.start()
+        atexit.register(self.close_all_connections)
+        # True when this instance created or upgraded the schema
+        self.schema_initialized = self.init_database()
     
-    def get_connection(self):
-        """Create a database connection"""
+    def _apply_pragmas(self, conn):
+        """Apply per-connection performance PRAGMAs"""
+        # NOTE: page_size must be changed before WAL is enabled, not here
+        conn.executescript('''
+            PRAGMA synchronous = NORMAL;
+            PRAGMA temp_store = MEMORY;
+            PRAGMA mmap_size = 268435456;
+            PRAGMA cache_size = -65536;
+            PRAGMA busy_timeout = 5000;
+        ''')
+    
+    def _connect(self, read_only=False):
+        """Open a new tuned connection"""
+        if read_only:
+            # Streamlit runs every rerun on a new thread, so readers are
+            # checked out of the pool by whichever thread needs one. A
+            # connection is only ever used by the thread holding it, which is
+            # what the same-thread check would otherwise enforce.
+            uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False,
+                                   cached_statements=STATEMENT_CACHE_SIZE)
+        else:
+            conn = sqlite3.connect(self.db_path, cached_statements=STATEMENT_CACHE_SIZE)
+        conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+        # Autocommit mode: transactions are opened explicitly where needed
+        conn.isolation_level = None
+        self._apply_pragmas(conn)
+        return conn
+    
+    def _writer_loop(self):
+        """Run queued write work, one unit per transaction, on one connection"""
         try:
-            conn = sqlite3.connect(self.db_path, check_same_thread=False)
-            conn.row_factory = sqlite3.Row  # Return rows as dictionaries
-            return conn
+            conn, error = self._connect(), None
         except Exception as e:
-            st.error(f"Database connection error: {e}")
-            return None
+            conn, error = None, e
+        
+        while True:
+            item = self._write_queue.get()
+            if item is None:
+                break
+            work, transaction, future = item
+            if conn is None:
+                future.set_exception(error)
+                continue
+            try:
+                if transaction:
+                    conn.execute("BEGIN IMMEDIATE")
+                result = work(conn.cursor())
+                if conn.in_transaction:
+                    conn.execute("COMMIT")
+            except BaseException as e:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+        
+        if conn is not None:
+            conn.close()
     
-    def init_database(self):
-        """Initialize database with all required tables"""
+    def _write(self, work, transaction=True):
+        """Run work(cursor) on the writer thread and return its result.
+        
+        work runs inside BEGIN IMMEDIATE ... COMMIT unless transaction is
+        False, in which case it manages its own transaction. Exceptions
+        raised by work are re-raised in the calling thread.
+        """
+        if not self._writer.is_alive():
+            raise sqlite3.ProgrammingError("Database writer has been shut down")
+        future = Future()
+        self._write_queue.put((work, transaction, future))
+        return future.result()
+    
+    def get_connection(self):
+        """Check out an idle read-only connection, opening one if none is idle.
+        
+        The caller has the connection to itself until it hands it back with
+        release_connection.
+        """
+        with self._pool_lock:
+            if self._pool:
+                return self._pool.pop()
+        
         try:
-            conn = self.get_connection()
-            if conn is None:
-                st.error("Failed to connect to database")
+            return self._connect(read_only=True)
+        except Exception:
+            logger.exception("Database connection error")
+            return None
+    
+    def release_connection(self, conn):
+        """Return a connection from get_connection to the pool"""
+        if conn.in_transaction:
+            conn.rollback()
+        with self._pool_lock:
+            if self._writer.is_alive() and len(self._pool) < READER_POOL_SIZE:
+                self._pool.append(conn)
                 return
+        conn.close()
+    
+    @contextmanager
+    def cursor(self):
+        """Yield a cursor on a read connection checked out for the block"""
+        conn = self.get_connection()
+        if conn is None:
+            raise sqlite3.OperationalError("Failed to connect to database")
+        cursor = conn.cursor()
+        try:
+            yield cursor
+        finally:
+            cursor.close()
+            self.release_connection(conn)
+    
+    def _fetch_one(self, sql, params):
+        """Run a cached point-lookup and return the row as a dict (or None)"""
+        with self.cursor() as cursor:
+            row = cursor.execute(sql, params).fetchone()
+            return dict(row) if row else None
+    
+    def _fetch_df(self, cursor, sql, params=()):
+        """Run a query and build a DataFrame straight from the fetched rows"""
+        rows = cursor.execute(sql, params).fetchall()
+        columns = [col[0] for col in cursor.description]
+        return pd.DataFrame.from_records(rows, columns=columns)
+    
+    def close_all_connections(self):
+        """Stop the writer thread and release every pooled connection"""
+        if self._writer.is_alive():
+            self.flush_notifications()
+            self._write_queue.put(None)
+            self._writer.join(timeout=5)
+        with self._pool_lock:
+            idle, self._pool = self._pool, []
+        for conn in idle:
+            conn.close()
+    
+    def init_database(self):
+        """Initialize database with all required tables.
+        
+        Returns True if the schema was created or upgraded, False if it was
+        already up to date or initialization failed.
+        """
+        def create_schema(cursor):
+            # Switch to write-ahead logging (persists across connections)
+            if self.db_path not in DatabaseManager._pragmas_set:
+                cursor.execute("PRAGMA journal_mode = WAL")
+                DatabaseManager._pragmas_set.add(self.db_path)
+            
+            # Skip all DDL when the schema is already up to date
+            if cursor.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+                return False
+            
+            # Tables are rebuilt the way SQLite documents it: foreign keys
+            # off while rows are copied (the PRAGMA is ignored inside a
+            # transaction), checked again before COMMIT, and switched back
+            # on by init_database afterwards
+            cursor.execute("PRAGMA foreign_keys = OFF")
+            
+            # Create the whole schema in one transaction (one commit/fsync)
+            cursor.execute("BEGIN IMMEDIATE")
             
-            cursor = conn.cursor()
+            # CREATE TABLE IF NOT EXISTS keeps tables an older version created,
+            # so move aside those whose layout has since changed; their rows
+            # are copied into the new tables below. No other table references
+            # them, so renaming first leaves every foreign key intact.
+            def columns(table):
+                return {row[1]: row[2].upper()
+                        for row in cursor.execute(f"PRAGMA table_info({table})")}
             
-            # Enable foreign keys
-            cursor.execute("PRAGMA foreign_keys = ON")
+            legacy = {
+                'nep_compliance': 'compliance_id' in columns('nep_compliance'),
+                'student_skills': 'skill_id' in columns('student_skills'),
+                'blockchain_credentials':
+                    columns('blockchain_credentials').get('credential_hash') == 'TEXT',
+            }
+            legacy = [table for table, is_legacy in legacy.items() if is_legacy]
+            for table in legacy:
+                cursor.execute(f"ALTER TABLE {table} RENAME TO {table}_legacy")
             
             # Users table
             cursor.execute('''
@@ -120,6 +450,16 @@ class DatabaseManager:
             )
             ''')
             
+            # Job skills, normalised from jobs.skills_required for indexed matching
+            cursor.execute('''
+            CREATE TABLE IF NOT EXISTS job_skills (
+                job_id INTEGER NOT NULL,
+                skill_name TEXT NOT NULL COLLATE NOCASE,
+                PRIMARY KEY (job_id, skill_name),
+                FOREIGN KEY (job_id) REFERENCES jobs(job_id) ON DELETE CASCADE
+            ) WITHOUT ROWID
+            ''')
+            
             # Applications table
             cursor.execute('''
             CREATE TABLE IF NOT EXISTS applications (
@@ -128,15 +468,24 @@ class DatabaseManager:
                 job_id INTEGER,
                 application_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 status TEXT DEFAULT 'pending' CHECK(status IN ('pending', 'reviewed', 'shortlisted', 'rejected', 'accepted')),
-                cover_letter TEXT,
-                resume_path TEXT,
-                feedback TEXT,
                 FOREIGN KEY (student_id) REFERENCES students(student_id) ON DELETE CASCADE,
                 FOREIGN KEY (job_id) REFERENCES jobs(job_id) ON DELETE CASCADE,
                 UNIQUE(student_id, job_id)
             )
             ''')
             
+            # Application text fields, kept out of the applications rows so
+            # list queries read fewer pages
+            cursor.execute('''
+            CREATE TABLE IF NOT EXISTS application_details (
+                application_id INTEGER PRIMARY KEY,
+                cover_letter TEXT,
+                resume_path TEXT,
+                feedback TEXT,
+                FOREIGN KEY (application_id) REFERENCES applications(application_id) ON DELETE CASCADE
+            )
+            ''')
+            
             # Placements table
             cursor.execute('''
             CREATE TABLE IF NOT EXISTS placements (
@@ -155,17 +504,17 @@ class DatabaseManager:
             )
             ''')
             
-            # Student skills table
+            # Student skills table (keyed by student, stored in the PK B-tree)
             cursor.execute('''
             CREATE TABLE IF NOT EXISTS student_skills (
-                skill_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                student_id INTEGER,
-                skill_name TEXT NOT NULL,
+                student_id INTEGER NOT NULL,
+                skill_name TEXT NOT NULL COLLATE NOCASE,
                 proficiency_level INTEGER CHECK(proficiency_level BETWEEN 1 AND 10),
                 certification TEXT,
                 verified BOOLEAN DEFAULT 0,
+                PRIMARY KEY (student_id, skill_name),
                 FOREIGN KEY (student_id) REFERENCES students(student_id) ON DELETE CASCADE
-            )
+            ) WITHOUT ROWID
             ''')
             
             # Interview feedback table
@@ -179,8 +528,6 @@ class DatabaseManager:
                 problem_solving INTEGER CHECK(problem_solving BETWEEN 1 AND 10),
                 attitude INTEGER CHECK(attitude BETWEEN 1 AND 10),
                 overall_rating INTEGER CHECK(overall_rating BETWEEN 1 AND 10),
-                strengths TEXT,
-                areas_for_improvement TEXT,
                 recommendation TEXT CHECK(recommendation IN ('strong_hire', 'hire', 'consider', 'reject')),
                 feedback_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
                 FOREIGN KEY (application_id) REFERENCES applications(application_id) ON DELETE CASCADE,
@@ -188,21 +535,35 @@ class DatabaseManager:
             )
             ''')
             
-            # NEP compliance table
+            # Interview feedback prose, split out like application_details
+            cursor.execute('''
+            CREATE TABLE IF NOT EXISTS interview_feedback_notes (
+                feedback_id INTEGER PRIMARY KEY,
+                strengths TEXT,
+                areas_for_improvement TEXT,
+                FOREIGN KEY (feedback_id) REFERENCES interview_feedback(feedback_id) ON DELETE CASCADE
+            )
+            ''')
+            
+            # NEP compliance table (one row per college and year)
             cursor.execute('''
             CREATE TABLE IF NOT EXISTS nep_compliance (
-                compliance_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                college_id INTEGER,
-                year INTEGER,
+                college_id INTEGER NOT NULL,
+                year INTEGER NOT NULL,
                 multidisciplinary_score INTEGER,
                 flexible_curriculum_score INTEGER,
                 skill_integration_score INTEGER,
                 digital_literacy_score INTEGER,
                 research_culture_score INTEGER,
                 industry_connect_score INTEGER,
-                overall_score REAL,
+                overall_score REAL GENERATED ALWAYS AS (
+                    (multidisciplinary_score + flexible_curriculum_score +
+                     skill_integration_score + digital_literacy_score +
+                     research_culture_score + industry_connect_score) / 6.0
+                ) STORED,
+                PRIMARY KEY (college_id, year),
                 FOREIGN KEY (college_id) REFERENCES colleges(college_id) ON DELETE CASCADE
-            )
+            ) WITHOUT ROWID
             ''')
             
             # Blockchain credentials table
@@ -211,12 +572,12 @@ class DatabaseManager:
                 credential_id INTEGER PRIMARY KEY AUTOINCREMENT,
                 student_id INTEGER,
                 credential_type TEXT NOT NULL,
-                credential_hash TEXT UNIQUE NOT NULL,
+                credential_hash BLOB UNIQUE NOT NULL,  -- raw 32-byte SHA-256
                 issuer TEXT,
                 issue_date DATE,
                 expiration_date DATE,
                 verified BOOLEAN DEFAULT 0,
-                blockchain_tx_id TEXT,
+                blockchain_tx_id BLOB,
                 metadata TEXT,
                 FOREIGN KEY (student_id) REFERENCES students(student_id) ON DELETE CASCADE
             )
@@ -236,96 +597,221 @@ class DatabaseManager:
             )
             ''')
             
+            # Copy rows out of the legacy tables, then drop them (before the
+            # indexes, so none is left attached to a table about to go).
+            # Older versions never enforced foreign keys, so rows whose parent
+            # was deleted are left behind rather than carried over.
+            if 'nep_compliance' in legacy:
+                # Latest row wins per college and year; overall_score is generated
+                score_columns = ", ".join(f"{key}_score" for key in NEP_SCORE_KEYS)
+                cursor.execute(f'''
+                    INSERT OR REPLACE INTO nep_compliance (college_id, year, {score_columns})
+                    SELECT college_id, year, {score_columns} FROM nep_compliance_legacy
+                    WHERE college_id IN (SELECT college_id FROM colleges) AND year IS NOT NULL
+                    ORDER BY compliance_id
+                ''')
+            
+            if 'student_skills' in legacy:
+                cursor.execute('''
+                    INSERT OR IGNORE INTO student_skills
+                        (student_id, skill_name, proficiency_level, certification, verified)
+                    SELECT student_id, TRIM(skill_name), proficiency_level, certification, verified
+                    FROM student_skills_legacy
+                    WHERE student_id IN (SELECT student_id FROM students)
+                    ORDER BY skill_id
+                ''')
+            
+            if 'blockchain_credentials' in legacy:
+                rows = cursor.execute('''
+                    SELECT credential_id, student_id, credential_type, credential_hash, issuer,
+                           issue_date, expiration_date, verified, blockchain_tx_id, metadata
+                    FROM blockchain_credentials_legacy
+                    WHERE student_id IS NULL OR student_id IN (SELECT student_id FROM students)
+                ''').fetchall()
+                cursor.executemany('''
+                    INSERT INTO blockchain_credentials
+                        (credential_id, student_id, credential_type, credential_hash, issuer,
+                         issue_date, expiration_date, verified, blockchain_tx_id, metadata)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', [
+                    (*row[:3], to_hash_value(row[3]), *row[4:8], to_hash_value(row[8]), row[9])
+                    for row in rows
+                ])
+            
+            for table in legacy:
+                cursor.execute(f"DROP TABLE {table}_legacy")
+            
+            # Older applications/interview_feedback rows still hold the text
+            # columns that now live in the side tables; move them across
+            text_columns = {
+                ('applications', 'application_details', 'application_id'):
+                    ('cover_letter', 'resume_path', 'feedback'),
+                ('interview_feedback', 'interview_feedback_notes', 'feedback_id'):
+                    ('strengths', 'areas_for_improvement'),
+            }
+            for (table, side_table, key), names in text_columns.items():
+                existing = [name for name in names if name in columns(table)]
+                if not existing:
+                    continue
+                cursor.execute(f'''
+                    INSERT OR IGNORE INTO {side_table} ({key}, {", ".join(existing)})
+                    SELECT {key}, {", ".join(existing)} FROM {table}
+                    WHERE {" OR ".join(f"{name} IS NOT NULL" for name in existing)}
+                ''')
+                for name in existing:
+                    cursor.execute(f"ALTER TABLE {table} DROP COLUMN {name}")
+            
             # Create indexes for performance
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_users_role ON users(role)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_recruiter ON jobs(recruiter_id)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_applications_student ON applications(student_id)')
             cursor.execute('CREATE INDEX IF NOT EXISTS idx_applications_job ON applications(job_id)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_notifications_user ON notifications(user_id)')
             
-            conn.commit()
-            conn.close()
+            # Composite indexes matching hot WHERE + ORDER BY patterns (no sort pass).
+            # They also serve plain student_id/user_id lookups, so the older
+            # single-column indexes on those are dropped rather than maintained twice.
+            cursor.execute('DROP INDEX IF EXISTS idx_applications_student')
+            cursor.execute('DROP INDEX IF EXISTS idx_notifications_user')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_apps_student_date ON applications(student_id, application_date DESC)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_jobs_active_date ON jobs(is_active, posted_date DESC)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_notif_user_read_date ON notifications(user_id, is_read, created_at DESC)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_students_college ON students(college_id)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_placements_college ON placements(college_id)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_job_skills_name ON job_skills(skill_name)')
+            cursor.execute('CREATE INDEX IF NOT EXISTS idx_student_skills_name ON student_skills(skill_name)')
             
-            st.success("Database initialized successfully!")
+            # Backfill the skill tables from the CSV columns of existing rows
+            jobs = cursor.execute('SELECT job_id, skills_required FROM jobs').fetchall()
+            cursor.executemany(SQL_ADD_JOB_SKILL, [
+                (job_id, skill) for job_id, csv in jobs for skill in split_skills(csv)
+            ])
+            students = cursor.execute('SELECT user_id, skills FROM students').fetchall()
+            cursor.executemany(SQL_ADD_STUDENT_SKILL, [
+                (skill, user_id) for user_id, csv in students for skill in split_skills(csv)
+            ])
             
-        except Exception as e:
-            st.error(f"Database initialization error: {e}")
-            st.code(traceback.format_exc())
+            # Refresh planner statistics so the new indexes get used
+            cursor.execute('ANALYZE')
+            
+            # The tables written above must not reference missing rows
+            for table in (*legacy, 'application_details', 'interview_feedback_notes'):
+                if cursor.execute(f"PRAGMA foreign_key_check({table})").fetchone():
+                    raise sqlite3.IntegrityError(f"Foreign key check failed for {table}")
+            
+            cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            cursor.execute("COMMIT")
+            return True
+        
+        try:
+            # Not wrapped: journal_mode can only change outside a transaction
+            return self._write(create_schema, transaction=False)
+        except Exception:
+            logger.exception("Database initialization error")
+            return False
+        finally:
+            # Every later write runs with foreign keys enforced
+            self._write(lambda cursor: cursor.execute("PRAGMA foreign_keys = ON"),
+                        transaction=False)
     
     # ================== USER MANAGEMENT ==================
     
     def create_user(self, username, email, password, role):
         """Create a new user"""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            cursor.execute(
-                "INSERT INTO users (username, email, password_hash, role) VALUES (?, ?, ?, ?)",
-                (username, email, password, role)
-            )
-            conn.commit()
-            user_id = cursor.lastrowid
-            conn.close()
-            return user_id
-        except Exception as e:
-            st.error(f"Error creating user: {e}")
+            # Hash in the calling thread so the writer is not held up
+            password_hash = hash_password(password)
+            
+            def work(cursor):
+                return cursor.execute(
+                    "INSERT INTO users (username, email, password_hash, role) "
+                    "VALUES (?, ?, ?, ?) RETURNING user_id",
+                    (username, email, password_hash, role)
+                ).fetchone()[0]
+            
+            return self._write(work)
+        except Exception:
+            logger.exception("Error creating user")
             return None
     
     def authenticate_user(self, username, password):
         """Authenticate a user"""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT * FROM users WHERE username = ? AND password_hash = ? AND is_active = 1",
-                (username, password)
-            )
-            user = cursor.fetchone()
-            conn.close()
-            return dict(user) if user else None
-        except Exception as e:
-            st.error(f"Authentication error: {e}")
+            user = self._fetch_one(SQL_AUTHENTICATE_USER, (username,))
+            if not user or not verify_password(password, user['password_hash']):
+                return None
+            if not is_bcrypt_hash(user['password_hash']):
+                # Replace a legacy plain-text password now that we know it
+                password_hash = hash_password(password)
+                self._write(lambda cursor: cursor.execute(
+                    "UPDATE users SET password_hash = ? WHERE user_id = ?",
+                    (password_hash, user['user_id'])
+                ))
+                user['password_hash'] = password_hash
+            return user
+        except Exception:
+            logger.exception("Authentication error")
             return None
     
     # ================== STUDENT OPERATIONS ==================
     
+    def _student_params(self, user_id, student_data):
+        """Build the SQL_CREATE_STUDENT parameter tuple for one student"""
+        return (
+            user_id, student_data['full_name'], student_data['enrollment_number'],
+            student_data.get('college_id'), student_data['department'], 
+            student_data['semester'], student_data.get('cgpa'), 
+            student_data['phone'], student_data.get('skills', '')
+        )
+    
     def create_student_profile(self, user_id, student_data):
         """Create student profile"""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO students (user_id, full_name, enrollment_number, college_id, 
-                                    department, semester, cgpa, phone, skills)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                user_id, student_data['full_name'], student_data['enrollment_number'],
-                student_data.get('college_id'), student_data['department'], 
-                student_data['semester'], student_data.get('cgpa'), 
-                student_data['phone'], student_data.get('skills', '')
-            ))
-            conn.commit()
-            student_id = cursor.lastrowid
-            conn.close()
-            return student_id
-        except Exception as e:
-            st.error(f"Error creating student profile: {e}")
+            def work(cursor):
+                student_id = cursor.execute(
+                    SQL_CREATE_STUDENT + " RETURNING student_id",
+                    self._student_params(user_id, student_data)
+                ).fetchone()[0]
+                cursor.executemany(SQL_ADD_STUDENT_SKILL, [
+                    (skill, user_id) for skill in split_skills(student_data.get('skills'))
+                ])
+                return student_id
+            
+            return self._write(work)
+        except Exception:
+            logger.exception("Error creating student profile")
             return None
     
+    def bulk_create_students(self, rows):
+        """Create many student profiles in one transaction.
+        
+        rows is an iterable of (user_id, student_data) pairs. Returns the
+        number of profiles inserted.
+        """
+        try:
+            rows = list(rows)
+            params = [self._student_params(user_id, data) for user_id, data in rows]
+            skills = [
+                (skill, user_id)
+                for user_id, data in rows
+                for skill in split_skills(data.get('skills'))
+            ]
+            
+            def work(cursor):
+                cursor.executemany(SQL_CREATE_STUDENT, params)
+                count = cursor.rowcount
+                cursor.executemany(SQL_ADD_STUDENT_SKILL, skills)
+                return count
+            
+            return self._write(work)
+        except Exception:
+            logger.exception("Error bulk creating students")
+            return 0
+    
     def get_student_by_user_id(self, user_id):
         """Get student profile by user ID"""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT * FROM students WHERE user_id = ?",
-                (user_id,)
-            )
-            student = cursor.fetchone()
-            conn.close()
-            return dict(student) if student else None
-        except Exception as e:
-            st.error(f"Error fetching student: {e}")
+            return self._fetch_one(SQL_STUDENT_BY_USER, (user_id,))
+        except Exception:
+            logger.exception("Error fetching student")
             return None
     
     # ================== COLLEGE OPERATIONS ==================
@@ -333,40 +819,30 @@ class DatabaseManager:
     def create_college_profile(self, user_id, college_data):
         """Create college profile"""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO colleges (user_id, college_name, university_affiliation, 
-                                    location, accreditation, contact_email, contact_phone, website)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                user_id, college_data['college_name'], college_data.get('university_affiliation'),
-                college_data['location'], college_data.get('accreditation'), 
-                college_data['contact_email'], college_data['contact_phone'],
-                college_data.get('website', '')
-            ))
-            conn.commit()
-            college_id = cursor.lastrowid
-            conn.close()
-            return college_id
-        except Exception as e:
-            st.error(f"Error creating college profile: {e}")
+            def work(cursor):
+                return cursor.execute('''
+                    INSERT INTO colleges (user_id, college_name, university_affiliation, 
+                                        location, accreditation, contact_email, contact_phone, website)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    RETURNING college_id
+                ''', (
+                    user_id, college_data['college_name'], college_data.get('university_affiliation'),
+                    college_data['location'], college_data.get('accreditation'), 
+                    college_data['contact_email'], college_data['contact_phone'],
+                    college_data.get('website', '')
+                )).fetchone()[0]
+            
+            return self._write(work)
+        except Exception:
+            logger.exception("Error creating college profile")
             return None
     
     def get_college_by_user_id(self, user_id):
         """Get college profile by user ID"""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT * FROM colleges WHERE user_id = ?",
-                (user_id,)
-            )
-            college = cursor.fetchone()
-            conn.close()
-            return dict(college) if college else None
-        except Exception as e:
-            st.error(f"Error fetching college: {e}")
+            return self._fetch_one(SQL_COLLEGE_BY_USER, (user_id,))
+        except Exception:
+            logger.exception("Error fetching college")
             return None
     
     # ================== RECRUITER OPERATIONS ==================
@@ -374,40 +850,30 @@ class DatabaseManager:
     def create_recruiter_profile(self, user_id, recruiter_data):
         """Create recruiter profile"""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO recruiters (user_id, company_name, industry, company_size,
-                                      website, contact_person, contact_email, contact_phone)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                user_id, recruiter_data['company_name'], recruiter_data.get('industry'),
-                recruiter_data.get('company_size'), recruiter_data.get('website'),
-                recruiter_data['contact_person'], recruiter_data['contact_email'],
-                recruiter_data['contact_phone']
-            ))
-            conn.commit()
-            recruiter_id = cursor.lastrowid
-            conn.close()
-            return recruiter_id
-        except Exception as e:
-            st.error(f"Error creating recruiter profile: {e}")
+            def work(cursor):
+                return cursor.execute('''
+                    INSERT INTO recruiters (user_id, company_name, industry, company_size,
+                                          website, contact_person, contact_email, contact_phone)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    RETURNING recruiter_id
+                ''', (
+                    user_id, recruiter_data['company_name'], recruiter_data.get('industry'),
+                    recruiter_data.get('company_size'), recruiter_data.get('website'),
+                    recruiter_data['contact_person'], recruiter_data['contact_email'],
+                    recruiter_data['contact_phone']
+                )).fetchone()[0]
+            
+            return self._write(work)
+        except Exception:
+            logger.exception("Error creating recruiter profile")
             return None
     
     def get_recruiter_by_user_id(self, user_id):
         """Get recruiter profile by user ID"""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT * FROM recruiters WHERE user_id = ?",
-                (user_id,)
-            )
-            recruiter = cursor.fetchone()
-            conn.close()
-            return dict(recruiter) if recruiter else None
-        except Exception as e:
-            st.error(f"Error fetching recruiter: {e}")
+            return self._fetch_one(SQL_RECRUITER_BY_USER, (user_id,))
+        except Exception:
+            logger.exception("Error fetching recruiter")
             return None
     
     # ================== JOB OPERATIONS ==================
@@ -415,60 +881,50 @@ class DatabaseManager:
     def create_job(self, recruiter_id, job_data):
         """Create a new job posting"""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO jobs (recruiter_id, title, description, requirements,
-                                location, job_type, salary_range, skills_required, deadline)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                recruiter_id, job_data['title'], job_data['description'],
-                job_data.get('requirements', ''), job_data['location'],
-                job_data['job_type'], job_data.get('salary_range', ''),
-                job_data.get('skills_required', ''), job_data.get('deadline')
-            ))
-            conn.commit()
-            job_id = cursor.lastrowid
-            conn.close()
-            return job_id
-        except Exception as e:
-            st.error(f"Error creating job: {e}")
+            def work(cursor):
+                job_id = cursor.execute('''
+                    INSERT INTO jobs (recruiter_id, title, description, requirements,
+                                    location, job_type, salary_range, skills_required, deadline)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    RETURNING job_id
+                ''', (
+                    recruiter_id, job_data['title'], job_data['description'],
+                    job_data.get('requirements', ''), job_data['location'],
+                    job_data['job_type'], job_data.get('salary_range', ''),
+                    job_data.get('skills_required', ''), job_data.get('deadline')
+                )).fetchone()[0]
+                cursor.executemany(SQL_ADD_JOB_SKILL, [
+                    (job_id, skill) for skill in split_skills(job_data.get('skills_required'))
+                ])
+                return job_id
+            
+            return self._write(work)
+        except Exception:
+            logger.exception("Error creating job")
             return None
     
     def get_jobs(self, filters=None):
         """Get all jobs with optional filters"""
         try:
-            conn = self.get_connection()
-            query = '''
-                SELECT j.*, r.company_name 
-                FROM jobs j
-                JOIN recruiters r ON j.recruiter_id = r.recruiter_id
-                WHERE j.is_active = 1
-            '''
-            params = []
-            
-            if filters:
-                conditions = []
-                if filters.get('job_type'):
-                    conditions.append("j.job_type = ?")
-                    params.append(filters['job_type'])
-                if filters.get('location'):
-                    conditions.append("j.location LIKE ?")
-                    params.append(f"%{filters['location']}%")
-                if filters.get('skills'):
-                    conditions.append("j.skills_required LIKE ?")
-                    params.append(f"%{filters['skills']}%")
+            with self.cursor() as cursor:
+                filters = filters or {}
+                active = [f for f in JOB_FILTERS if filters.get(f[0])]
                 
-                if conditions:
-                    query += " AND " + " AND ".join(conditions)
-            
-            query += " ORDER BY j.posted_date DESC"
-            
-            df = pd.read_sql_query(query, conn, params=params)
-            conn.close()
-            return df
-        except Exception as e:
-            st.error(f"Error fetching jobs: {e}")
+                # At most 2^len(JOB_FILTERS) distinct SQL texts; build each once
+                key = frozenset(name for name, _, _ in active)
+                query = self._jobs_stmts.get(key)
+                if query is None:
+                    query = SQL_GET_JOBS
+                    if active:
+                        query += " AND " + " AND ".join(cond for _, cond, _ in active)
+                    query += " ORDER BY j.posted_date DESC"
+                    self._jobs_stmts[key] = query
+                
+                params = [pattern.format(filters[name]) for name, _, pattern in active]
+                df = self._fetch_df(cursor, query, params)
+                return df
+        except Exception:
+            logger.exception("Error fetching jobs")
             return pd.DataFrame()
     
     # ================== APPLICATION OPERATIONS ==================
@@ -476,37 +932,58 @@ class DatabaseManager:
     def create_application(self, student_id, job_id, cover_letter="", resume_path=""):
         """Create a job application"""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO applications (student_id, job_id, cover_letter, resume_path)
-                VALUES (?, ?, ?, ?)
-            ''', (student_id, job_id, cover_letter, resume_path))
-            conn.commit()
-            application_id = cursor.lastrowid
-            conn.close()
-            return application_id
-        except Exception as e:
-            st.error(f"Error creating application: {e}")
+            def work(cursor):
+                # A repeat application is the common failure; skip it
+                # without raising and report it as None
+                row = cursor.execute(
+                    "INSERT INTO applications (student_id, job_id) VALUES (?, ?) "
+                    "ON CONFLICT (student_id, job_id) DO NOTHING "
+                    "RETURNING application_id",
+                    (student_id, job_id)
+                ).fetchone()
+                if row is None:
+                    return None
+                application_id = row[0]
+                cursor.execute('''
+                    INSERT INTO application_details (application_id, cover_letter, resume_path)
+                    VALUES (?, ?, ?)
+                ''', (application_id, cover_letter, resume_path))
+                return application_id
+            
+            return self._write(work)
+        except Exception:
+            logger.exception("Error creating application")
+            return None
+    
+    def get_application_details(self, application_id):
+        """Get the cover letter, resume path and feedback of an application"""
+        try:
+            return self._fetch_one(
+                "SELECT * FROM application_details WHERE application_id = ?",
+                (application_id,)
+            )
+        except Exception:
+            logger.exception("Error fetching application details")
             return None
     
     def get_student_applications(self, student_id):
         """Get all applications for a student"""
         try:
-            conn = self.get_connection()
-            query = '''
-                SELECT a.*, j.title, r.company_name, j.location
-                FROM applications a
-                JOIN jobs j ON a.job_id = j.job_id
-                JOIN recruiters r ON j.recruiter_id = r.recruiter_id
-                WHERE a.student_id = ?
-                ORDER BY a.application_date DESC
-            '''
-            df = pd.read_sql_query(query, conn, params=(student_id,))
-            conn.close()
-            return df
-        except Exception as e:
-            st.error(f"Error fetching applications: {e}")
+            with self.cursor() as cursor:
+                query = '''
+                    SELECT a.application_id, a.student_id, a.job_id,
+                           a.application_date, a.status,
+                           j.title, r.company_name, j.location
+                    FROM applications a
+                    JOIN jobs j ON a.job_id = j.job_id
+                    JOIN recruiters r ON j.recruiter_id = r.recruiter_id
+                    WHERE a.student_id = ?
+                    ORDER BY a.application_date DESC
+                '''
+                df = self._fetch_df(cursor, query, (student_id,))
+                return df
+        except Exception:
+            logger.exception("Error fetching applications")
             return pd.DataFrame()
     
     # ================== ANALYTICS & DASHBOARD ==================
@@ -514,81 +991,31 @@ class DatabaseManager:
     def get_dashboard_stats(self, user_id, role):
         """Get dashboard statistics based on user role"""
         try:
-            conn = self.get_connection()
-            stats = {}
-            
-            if role == 'student':
-                cursor = conn.cursor()
-                cursor.execute(
-                    "SELECT student_id FROM students WHERE user_id = ?",
-                    (user_id,)
-                )
-                student = cursor.fetchone()
-                if student:
-                    student_id = student['student_id']
-                    # Get application stats
-                    cursor.execute('''
-                        SELECT COUNT(*) as total,
-                               SUM(CASE WHEN status = 'accepted' THEN 1 ELSE 0 END) as accepted,
-                               SUM(CASE WHEN status = 'shortlisted' THEN 1 ELSE 0 END) as shortlisted
-                        FROM applications
-                        WHERE student_id = ?
-                    ''', (student_id,))
-                    app_stats = cursor.fetchone()
-                    stats['applications'] = dict(app_stats)
-            
-            elif role == 'recruiter':
-                cursor = conn.cursor()
-                cursor.execute(
-                    "SELECT recruiter_id FROM recruiters WHERE user_id = ?",
-                    (user_id,)
-                )
-                recruiter = cursor.fetchone()
-                if recruiter:
-                    recruiter_id = recruiter['recruiter_id']
-                    # Get job stats
-                    cursor.execute('''
-                        SELECT COUNT(*) as total_jobs,
-                               SUM(CASE WHEN is_active = 1 THEN 1 ELSE 0 END) as active_jobs
-                        FROM jobs
-                        WHERE recruiter_id = ?
-                    ''', (recruiter_id,))
-                    job_stats = cursor.fetchone()
-                    stats['jobs'] = dict(job_stats)
-            
-            elif role == 'college_admin':
-                cursor = conn.cursor()
-                cursor.execute(
-                    "SELECT college_id FROM colleges WHERE user_id = ?",
-                    (user_id,)
-                )
-                college = cursor.fetchone()
-                if college:
-                    college_id = college['college_id']
-                    # Get student stats
-                    cursor.execute('''
-                        SELECT COUNT(*) as total_students,
-                               AVG(cgpa) as avg_cgpa
-                        FROM students
-                        WHERE college_id = ?
-                    ''', (college_id,))
-                    student_stats = cursor.fetchone()
-                    stats['students'] = dict(student_stats)
-                    
-                    # Get placement stats
-                    cursor.execute('''
-                        SELECT COUNT(*) as total_placements
-                        FROM placements
-                        WHERE college_id = ?
-                    ''', (college_id,))
-                    placement_stats = cursor.fetchone()
-                    stats['placements'] = dict(placement_stats)
-            
-            conn.close()
-            return stats
-            
-        except Exception as e:
-            st.error(f"Error fetching dashboard stats: {e}")
+            with self.cursor() as cursor:
+                stats = {}
+                
+                if role == 'student':
+                    row = cursor.execute(SQL_STUDENT_DASHBOARD, (user_id,)).fetchone()
+                    if row:
+                        stats['applications'] = dict(row)
+                
+                elif role == 'recruiter':
+                    row = cursor.execute(SQL_RECRUITER_DASHBOARD, (user_id,)).fetchone()
+                    if row:
+                        stats['jobs'] = dict(row)
+                
+                elif role == 'college_admin':
+                    row = cursor.execute(SQL_COLLEGE_DASHBOARD, (user_id,)).fetchone()
+                    if row:
+                        stats['students'] = {
+                            'total_students': row['total_students'],
+                            'avg_cgpa': row['avg_cgpa']
+                        }
+                        stats['placements'] = {'total_placements': row['total_placements']}
+                
+                return stats
+        except Exception:
+            logger.exception("Error fetching dashboard stats")
             return {}
     
     # ================== NEP COMPLIANCE ==================
@@ -596,72 +1023,158 @@ class DatabaseManager:
     def save_nep_compliance_score(self, college_id, year, scores):
         """Save NEP 2020 compliance scores"""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            overall_score = sum(scores.values()) / len(scores)
-            
-            cursor.execute('''
-                INSERT INTO nep_compliance 
-                (college_id, year, multidisciplinary_score, flexible_curriculum_score,
-                 skill_integration_score, digital_literacy_score, research_culture_score,
-                 industry_connect_score, overall_score)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                college_id, year,
-                scores.get('multidisciplinary', 0),
-                scores.get('flexible_curriculum', 0),
-                scores.get('skill_integration', 0),
-                scores.get('digital_literacy', 0),
-                scores.get('research_culture', 0),
-                scores.get('industry_connect', 0),
-                overall_score
-            ))
+            def work(cursor):
+                # overall_score is a generated column computed by SQLite;
+                # saving the same college and year again replaces the scores
+                cursor.execute('''
+                    INSERT INTO nep_compliance 
+                    (college_id, year, multidisciplinary_score, flexible_curriculum_score,
+                     skill_integration_score, digital_literacy_score, research_culture_score,
+                     industry_connect_score)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT (college_id, year) DO UPDATE SET
+                        multidisciplinary_score = excluded.multidisciplinary_score,
+                        flexible_curriculum_score = excluded.flexible_curriculum_score,
+                        skill_integration_score = excluded.skill_integration_score,
+                        digital_literacy_score = excluded.digital_literacy_score,
+                        research_culture_score = excluded.research_culture_score,
+                        industry_connect_score = excluded.industry_connect_score
+                ''', (college_id, year, *(scores.get(key, 0) for key in NEP_SCORE_KEYS)))
             
-            conn.commit()
-            conn.close()
+            self._write(work)
             return True
-        except Exception as e:
-            st.error(f"Error saving NEP compliance: {e}")
+        except Exception:
+            logger.exception("Error saving NEP compliance")
             return False
     
+    # ================== BLOCKCHAIN CREDENTIALS ==================
+    
+    def create_blockchain_credential(self, student_id, credential_type, credential_hash,
+                                     issuer=None, blockchain_tx_id=None, metadata=None):
+        """Store a credential; hashes may be given as hex strings or bytes.
+        
+        blockchain_tx_id is stored as raw bytes when it is hex (with or
+        without 0x) and as text otherwise.
+        """
+        try:
+            params = (
+                student_id, credential_type, to_hash_bytes(credential_hash), issuer,
+                to_hash_value(blockchain_tx_id), metadata
+            )
+            return self._write(lambda cursor: cursor.execute('''
+                INSERT INTO blockchain_credentials (student_id, credential_type, credential_hash,
+                                                    issuer, issue_date, blockchain_tx_id, metadata)
+                VALUES (?, ?, ?, ?, DATE('now'), ?, ?)
+                RETURNING credential_id
+            ''', params).fetchone()[0])
+        except Exception:
+            logger.exception("Error creating blockchain credential")
+            return None
+    
+    def get_credential_by_hash(self, credential_hash):
+        """Look up a credential by its hash (hex string or bytes)"""
+        try:
+            # Non-hex values can only match legacy hashes stored as text
+            return self._fetch_one(
+                "SELECT * FROM blockchain_credentials WHERE credential_hash = ?",
+                (to_hash_value(credential_hash),)
+            )
+        except Exception:
+            logger.exception("Error fetching blockchain credential")
+            return None
+    
     # ================== NOTIFICATIONS ==================
     
     def create_notification(self, user_id, title, message, notification_type='info'):
-        """Create a new notification"""
-        try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO notifications (user_id, title, message, notification_type)
-                VALUES (?, ?, ?, ?)
-            ''', (user_id, title, message, notification_type))
-            conn.commit()
-            conn.close()
-            return True
-        except Exception as e:
-            st.error(f"Error creating notification: {e}")
+        """Create a new notification (buffered, see flush_notifications).
+        
+        True means the notification was queued, not that it was stored: a
+        row that fails the user foreign key is dropped when the buffer is
+        flushed, and only flush_notifications reports that.
+        """
+        # Reject rows that would fail the NOT NULL/CHECK constraints now;
+        # rows failing the user foreign key are dropped at flush time
+        if title is None or message is None or notification_type not in NOTIFICATION_TYPES:
+            logger.warning("Rejected invalid notification %r (type %r)", title, notification_type)
             return False
+        
+        with self._notif_lock:
+            self._notif_buf.append((user_id, title, message, notification_type))
+            full = len(self._notif_buf) >= NOTIFICATION_FLUSH_ROWS
+            if not full and self._notif_timer is None:
+                self._notif_timer = threading.Timer(
+                    NOTIFICATION_FLUSH_INTERVAL, self.flush_notifications
+                )
+                self._notif_timer.daemon = True
+                self._notif_timer.start()
+        
+        if full:
+            return self.flush_notifications()
+        return True
     
-    def get_user_notifications(self, user_id, unread_only=False):
-        """Get notifications for a user"""
-        try:
-            conn = self.get_connection()
-            query = '''
-                SELECT * FROM notifications 
-                WHERE user_id = ?
-            '''
-            params = [user_id]
+    def flush_notifications(self):
+        """Write all buffered notifications in one transaction"""
+        # Serialise flushes so a caller never returns while another flush
+        # still has rows in flight
+        with self._notif_flush_lock:
+            with self._notif_lock:
+                rows, self._notif_buf = self._notif_buf, []
+                if self._notif_timer is not None:
+                    self._notif_timer.cancel()
+                    self._notif_timer = None
             
-            if unread_only:
-                query += " AND is_read = 0"
+            if not rows:
+                return True
             
-            query += " ORDER BY created_at DESC LIMIT 20"
+            def work(cursor):
+                cursor.execute("SAVEPOINT notification_batch")
+                try:
+                    cursor.executemany(SQL_CREATE_NOTIFICATION, rows)
+                except sqlite3.IntegrityError:
+                    # A row failed (e.g. unknown user_id): undo the batch and
+                    # insert row by row so only the bad rows are lost
+                    cursor.execute("ROLLBACK TO notification_batch")
+                    rejected = []
+                    for row in rows:
+                        try:
+                            cursor.execute(SQL_CREATE_NOTIFICATION, row)
+                        except sqlite3.IntegrityError:
+                            rejected.append(row)
+                    return rejected
+                finally:
+                    cursor.execute("RELEASE notification_batch")
+                return []
             
-            df = pd.read_sql_query(query, conn, params=params)
-            conn.close()
-            return df
-        except Exception as e:
-            st.error(f"Error fetching notifications: {e}")
+            try:
+                rejected = self._write(work)
+            except Exception:
+                logger.exception("Error creating notifications")
+                return False
+            for user_id, title, _, _ in rejected:
+                logger.warning("Dropped notification %r for user %r: constraint failed", title, user_id)
+            return not rejected
+    
+    def get_user_notifications(self, user_id, unread_only=False):
+        """Get notifications for a user"""
+        # Make sure buffered notifications are visible to the reader
+        self.flush_notifications()
+        try:
+            with self.cursor() as cursor:
+                query = '''
+                    SELECT * FROM notifications 
+                    WHERE user_id = ?
+                '''
+                params = [user_id]
+                
+                if unread_only:
+                    query += " AND is_read = 0"
+                
+                query += " ORDER BY created_at DESC LIMIT 20"
+                
+                df = self._fetch_df(cursor, query, params)
+                return df
+        except Exception:
+            logger.exception("Error fetching notifications")
             return pd.DataFrame()
     
     # ================== DEMO DATA ==================
@@ -669,33 +1182,20 @@ class DatabaseManager:
     def create_demo_data(self):
         """Create demo data for testing"""
         try:
-            conn = self.get_connection()
-            cursor = conn.cursor()
-            
             # Create demo users
+            demo_password = hash_password('password123')
             demo_users = [
-                ('student1', 'student1@demo.com', 'password123', 'student'),
-                ('college1', 'college1@demo.com', 'password123', 'college_admin'),
-                ('recruiter1', 'recruiter1@demo.com', 'password123', 'recruiter'),
+                ('student1', 'student1@demo.com', demo_password, 'student'),
+                ('college1', 'college1@demo.com', demo_password, 'college_admin'),
+                ('recruiter1', 'recruiter1@demo.com', demo_password, 'recruiter'),
             ]
             
-            for user in demo_users:
-                cursor.execute(
-                    "INSERT OR IGNORE INTO users (username, email, password_hash, role) VALUES (?, ?, ?, ?)",
-                    user
-                )
-            
-            conn.commit()
-            conn.close()
-            st.success("Demo data created successfully!")
+            # Insert all rows in a single transaction
+            self._write(lambda cursor: cursor.executemany(
+                "INSERT OR IGNORE INTO users (username, email, password_hash, role) VALUES (?, ?, ?, ?)",
+                demo_users
+            ))
             return True
-        except Exception as e:
-            st.error(f"Error creating demo data: {e}")
+        except Exception:
+            logger.exception("Error creating demo data")
             return False
-
-# Initialize database manager
-try:
-    db_manager = DatabaseManager()
-except Exception as e:
-    st.error(f"Failed to initialize database: {e}")
-    db_manager = None
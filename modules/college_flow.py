@@ -4,26 +4,99 @@ import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import numpy as np
-from database.db_manager import db_manager
+import pyarrow as pa
+
+# Drive, interview and placement dates are relative to datetime.now(), so
+# rebuild hourly to keep "upcoming" and "days until" current
+@st.cache_data(show_spinner=False, ttl=timedelta(hours=1))
+def load_sample_college_data():
+    """Build the seeded sample data at most hourly; each caller gets its own copy"""
+    return {
+        "college_id": 1,  # Default college ID
+        "college_name": "ABC Engineering College",
+        "students": CollegeFlow.generate_sample_students(),
+        "companies": CollegeFlow.generate_sample_companies(),
+        "drives": CollegeFlow.generate_sample_drives(),
+        "placements": CollegeFlow.generate_sample_placements(),
+        "interviews": CollegeFlow.generate_sample_interviews()
+    }
+
+MONTHS = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
+
+@st.cache_data(show_spinner=False)
+def sample_placement_trend():
+    """Simulated monthly placements and interviews"""
+    return pd.DataFrame({
+        'Month': MONTHS,
+        'Placements': [5, 8, 12, 15, 20, 25, 30, 35, 40, 42, 45, 50],
+        'Interviews': [20, 25, 30, 35, 40, 45, 50, 55, 60, 62, 65, 70]
+    })
+
+@st.cache_data(show_spinner=False)
+def sample_kpi_metrics():
+    """Simulated placement KPIs against their targets"""
+    metrics_df = pd.DataFrame({
+        'Metric': ['CGPA > 8.0', 'Internship Experience', 'Technical Skills', 
+                  'Communication Skills', 'Projects Completed'],
+        'Current': [45, 60, 70, 65, 55],
+        'Target': [60, 75, 85, 80, 70]
+    })
+    metrics_df['Gap'] = metrics_df['Target'] - metrics_df['Current']
+    return metrics_df
+
+@st.cache_data(show_spinner=False)
+def sample_drive_trend():
+    """Simulated number of drives per month"""
+    return pd.DataFrame({
+        'Month': MONTHS,
+        'Drives': [2, 3, 4, 3, 5, 4, 2, 1, 3, 4, 5, 3]
+    })
+
+@st.cache_data(show_spinner=False)
+def sample_year_comparison():
+    """Simulated year-over-year placement rate and average package"""
+    return pd.DataFrame({
+        'Year': [2021, 2022, 2023, 2024],
+        'Placement Rate': [65, 72, 78, 82],
+        'Avg Package': [10.5, 12.2, 14.5, 16.8]
+    })
+
+# Static table shown as-is, so it is kept as an Arrow table: st.dataframe
+# sends it without a pandas-to-Arrow conversion on every rerun
+@st.cache_data(show_spinner=False)
+def sample_performance_summary():
+    """Simulated performance summary against targets"""
+    return pa.table({
+        'Metric': ['Placement Rate', 'Avg Package', 'Highest Package', 
+                  'Internship Rate', 'Multiple Offers', 'Dream Offers'],
+        'Current': [82, 16.8, 42.5, 15, 8, 12],
+        'Target': [85, 18.0, 50.0, 20, 10, 15],
+        'Trend': ['↗️', '↗️', '↗️', '→', '↗️', '↗️']
+    })
 
 class CollegeFlow:
+    # (step name, render method) in workflow order
+    STEPS = (
+        ("👨‍🎓 Student Database", "step1_student_database"),
+        ("📊 Analytics Dashboard", "step2_analytics_dashboard"),
+        ("🏢 Company Registration", "step3_company_registration"),
+        ("📅 Drive Scheduling", "step4_drive_scheduling"),
+        ("🎯 Student-Company Matching", "step5_student_company_matching"),
+        ("📝 Interview Management", "step6_interview_management"),
+        ("✅ Placement Records", "step7_placement_records"),
+        ("📈 Performance Reports", "step8_performance_reports"),
+    )
+    
     def __init__(self):
         self.college_data = self.initialize_college_data()
         self.current_step = 1
     
     def initialize_college_data(self):
         """Initialize college data"""
-        return {
-            "college_id": 1,  # Default college ID
-            "college_name": "ABC Engineering College",
-            "students": self.generate_sample_students(),
-            "companies": self.generate_sample_companies(),
-            "drives": self.generate_sample_drives(),
-            "placements": self.generate_sample_placements(),
-            "interviews": self.generate_sample_interviews()
-        }
+        return load_sample_college_data()
     
-    def generate_sample_students(self):
+    @staticmethod
+    def generate_sample_students():
         """Generate sample student data"""
         np.random.seed(42)
         n_students = 150
@@ -62,7 +135,8 @@ class CollegeFlow:
         
         return pd.DataFrame(data)
     
-    def generate_sample_companies(self):
+    @staticmethod
+    def generate_sample_companies():
         """Generate sample company data"""
         companies = [
             {
@@ -133,7 +207,8 @@ class CollegeFlow:
         ]
         return pd.DataFrame(companies)
     
-    def generate_sample_drives(self):
+    @staticmethod
+    def generate_sample_drives():
         """Generate sample campus drives"""
         drives = []
         companies = ["Google", "Microsoft", "Amazon", "TCS", "Infosys"]
@@ -157,7 +232,8 @@ class CollegeFlow:
         
         return pd.DataFrame(drives)
     
-    def generate_sample_placements(self):
+    @staticmethod
+    def generate_sample_placements():
         """Generate sample placement records"""
         placements = []
         companies = ["Google", "Microsoft", "Amazon", "TCS", "Infosys", 
@@ -180,7 +256,8 @@ class CollegeFlow:
         
         return pd.DataFrame(placements)
     
-    def generate_sample_interviews(self):
+    @staticmethod
+    def generate_sample_interviews():
         """Generate sample interview records"""
         interviews = []
         rounds = ["Aptitude Test", "Technical Round 1", "Technical Round 2", "HR Round", "Managerial Round"]
@@ -213,44 +290,20 @@ class CollegeFlow:
         current_step = st.session_state.get('current_step_college', 1)
         self.current_step = current_step
     
-        # Display step header
-        step_names = {
-            1: "👨‍🎓 Student Database",
-            2: "📊 Analytics Dashboard",
-            3: "🏢 Company Registration",
-            4: "📅 Drive Scheduling",
-            5: "🎯 Student-Company Matching",
-            6: "📝 Interview Management",
-            7: "✅ Placement Records",
-            8: "📈 Performance Reports"
-        }
+        step_name, render = self.STEPS[current_step - 1]
+        total_steps = len(self.STEPS)
     
         # Create header with progress
         col1, col2 = st.columns([3, 1])
         with col1:
-            st.subheader(f"Step {current_step}: {step_names[current_step]}")
+            st.subheader(f"Step {current_step}: {step_name}")
         with col2:
-            progress = current_step / 8
+            progress = current_step / total_steps
             st.progress(progress)
-            st.caption(f"Step {current_step} of 8")
+            st.caption(f"Step {current_step} of {total_steps}")
     
         # Display appropriate step
-        if current_step == 1:
-            self.step1_student_database()
-        elif current_step == 2:
-            self.step2_analytics_dashboard()
-        elif current_step == 3:
-            self.step3_company_registration()
-        elif current_step == 4:
-            self.step4_drive_scheduling()
-        elif current_step == 5:
-            self.step5_student_company_matching()
-        elif current_step == 6:
-            self.step6_interview_management()
-        elif current_step == 7:
-            self.step7_placement_records()
-        elif current_step == 8:
-            self.step8_performance_reports()
+        getattr(self, render)()
     
         # Navigation
         self.display_workflow_navigation(current_step)
@@ -419,15 +472,7 @@ class CollegeFlow:
         
         with tab3:
             # Monthly trends (simulated)
-            months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-            placements_trend = [5, 8, 12, 15, 20, 25, 30, 35, 40, 42, 45, 50]
-            interviews_trend = [20, 25, 30, 35, 40, 45, 50, 55, 60, 62, 65, 70]
-            
-            trend_data = pd.DataFrame({
-                'Month': months,
-                'Placements': placements_trend,
-                'Interviews': interviews_trend
-            })
+            trend_data = sample_placement_trend()
             
             fig5 = px.line(trend_data, x='Month', y=['Placements', 'Interviews'],
                           title="Monthly Placement Trends",
@@ -477,22 +522,12 @@ class CollegeFlow:
             # Key metrics affecting placement
             st.subheader("Key Performance Indicators")
             
-            metrics_data = {
-                'Metric': ['CGPA > 8.0', 'Internship Experience', 'Technical Skills', 
-                          'Communication Skills', 'Projects Completed'],
-                'Current': [45, 60, 70, 65, 55],
-                'Target': [60, 75, 85, 80, 70]
-            }
-            
-            metrics_df = pd.DataFrame(metrics_data)
-            metrics_df['Gap'] = metrics_df['Target'] - metrics_df['Current']
+            metrics_df = sample_kpi_metrics()
             
-            for _, row in metrics_df.iterrows():
-                progress = row['Current'] / row['Target']
-                color = "green" if progress >= 0.9 else "orange" if progress >= 0.7 else "red"
-                
-                st.write(f"**{row['Metric']}:** {row['Current']}% (Target: {row['Target']}%)")
-                st.progress(progress)
+            fig8 = px.bar(metrics_df, x='Metric', y=['Current', 'Target'],
+                         barmode='group',
+                         title="Current vs Target (%)")
+            st.plotly_chart(fig8, use_container_width=True)
     
     def step3_company_registration(self):
         """Step 3: Company Registration & Management"""
@@ -592,40 +627,7 @@ class CollegeFlow:
             
             # Display companies
             for _, company in filtered_companies.iterrows():
-                with st.expander(f"🏢 {company['name']} ({company['industry']})", expanded=False):
-                    col1, col2 = st.columns(2)
-                    
-                    with col1:
-                        st.write("**Contact Information:**")
-                        st.write(f"**Contact:** {company['contact_person']}")
-                        st.write(f"**Email:** {company['contact_email']}")
-                        st.write(f"**Phone:** {company['contact_phone']}")
-                        st.write(f"**Website:** {company['website']}")
-                    
-                    with col2:
-                        st.write("**Recruitment Stats:**")
-                        st.write(f"**Status:** {company['recruitment_status']}")
-                        st.write(f"**Visits this year:** {company['visits_this_year']}")
-                        st.write(f"**Total hires:** {company['total_hires']}")
-                        st.write(f"**Avg package:** ₹{company['avg_package']}L")
-                    
-                    # Action buttons
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        if st.button(f"📅 Schedule Drive", key=f"schedule_{company['company_id']}", width='stretch'):
-                            st.session_state.selected_company = company['name']
-                            from modules.workflow_manager import WorkflowManager
-                            workflow = WorkflowManager()
-                            workflow.workflows["college"]["current_step"] = 4
-                            st.rerun()
-                    
-                    with col2:
-                        if st.button(f"✏️ Edit", key=f"edit_{company['company_id']}", width='stretch'):
-                            st.info(f"Editing {company['name']} - Form would appear here")
-                    
-                    with col3:
-                        if st.button(f"📧 Contact", key=f"contact_{company['company_id']}", width='stretch'):
-                            st.info(f"Opening email to {company['contact_email']}")
+                self.company_card(company)
             
             # Company statistics
             st.subheader("Company Statistics")
@@ -663,6 +665,42 @@ class CollegeFlow:
                          title="Package Distribution by Industry")
             st.plotly_chart(fig3, use_container_width=True)
     
+    @st.fragment
+    def company_card(self, company):
+        """Company details and actions; Edit/Contact rerun only this card"""
+        with st.expander(f"🏢 {company['name']} ({company['industry']})", expanded=False):
+            col1, col2 = st.columns(2)
+
+            with col1:
+                st.write("**Contact Information:**")
+                st.write(f"**Contact:** {company['contact_person']}")
+                st.write(f"**Email:** {company['contact_email']}")
+                st.write(f"**Phone:** {company['contact_phone']}")
+                st.write(f"**Website:** {company['website']}")
+
+            with col2:
+                st.write("**Recruitment Stats:**")
+                st.write(f"**Status:** {company['recruitment_status']}")
+                st.write(f"**Visits this year:** {company['visits_this_year']}")
+                st.write(f"**Total hires:** {company['total_hires']}")
+                st.write(f"**Avg package:** ₹{company['avg_package']}L")
+
+            # Action buttons
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                if st.button(f"📅 Schedule Drive", key=f"schedule_{company['company_id']}", width='stretch'):
+                    st.session_state.selected_company = company['name']
+                    st.session_state.current_step_college = 4
+                    st.rerun()
+
+            with col2:
+                if st.button(f"✏️ Edit", key=f"edit_{company['company_id']}", width='stretch'):
+                    st.info(f"Editing {company['name']} - Form would appear here")
+
+            with col3:
+                if st.button(f"📧 Contact", key=f"contact_{company['company_id']}", width='stretch'):
+                    st.info(f"Opening email to {company['contact_email']}")
+    
     def step4_drive_scheduling(self):
         """Step 4: Campus Drive Scheduling"""
         st.info("Schedule and manage campus recruitment drives")
@@ -804,41 +842,7 @@ class CollegeFlow:
                 for _, drive in upcoming_drives.sort_values("date").iterrows():
                     days_until = (datetime.strptime(drive["date"], "%Y-%m-%d") - datetime.now()).days
                     
-                    with st.expander(f"{drive['company']} - {drive['date']} ({days_until} days)", expanded=False):
-                        col1, col2 = st.columns(2)
-                        
-                        with col1:
-                            st.write("**Drive Details:**")
-                            st.write(f"**ID:** {drive['drive_id']}")
-                            st.write(f"**Mode:** {drive['mode']}")
-                            st.write(f"**Venue:** {drive['venue']}")
-                            st.write(f"**Time:** {drive.get('time', '10:00')}")
-                        
-                        with col2:
-                            st.write("**Registration:**")
-                            st.write(f"**Deadline:** {drive.get('registration_deadline', 'N/A')}")
-                            st.write(f"**Registered:** {drive['registered']}/{drive.get('expected_students', 150)}")
-                            st.write(f"**Vacancies:** {drive.get('vacancies', 10)}")
-                            st.write(f"**Status:** {drive['status']}")
-                        
-                        # Action buttons
-                        col1, col2, col3 = st.columns(3)
-                        with col1:
-                            if st.button("👥 View Registrations", key=f"view_{drive['drive_id']}", width='stretch'):
-                                st.info(f"Showing registrations for {drive['company']} drive")
-                        
-                        with col2:
-                            if st.button("📝 Manage", key=f"manage_{drive['drive_id']}", width='stretch'):
-                                st.info(f"Managing {drive['company']} drive")
-                        
-                        with col3:
-                            if drive['status'] == 'Scheduled' and st.button("✅ Mark Complete", key=f"complete_{drive['drive_id']}", width='stretch'):
-                                self.college_data["drives"].loc[
-                                    self.college_data["drives"]["drive_id"] == drive['drive_id'], 
-                                    'status'
-                                ] = 'Completed'
-                                st.success(f"Drive marked as completed!")
-                                st.rerun()
+                    self.drive_card(drive, days_until)
             else:
                 st.info("No upcoming drives scheduled")
             
@@ -882,19 +886,52 @@ class CollegeFlow:
                 st.plotly_chart(fig1, use_container_width=True)
             
             # Monthly drive trend
-            months = ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec']
-            drives_per_month = [2, 3, 4, 3, 5, 4, 2, 1, 3, 4, 5, 3]  # Sample data
-            
-            trend_data = pd.DataFrame({
-                'Month': months,
-                'Drives': drives_per_month
-            })
+            trend_data = sample_drive_trend()
             
             fig2 = px.line(trend_data, x='Month', y='Drives',
                           title="Monthly Drive Trend",
                           markers=True)
             st.plotly_chart(fig2, use_container_width=True)
     
+    @st.fragment
+    def drive_card(self, drive, days_until):
+        """Upcoming drive details and actions; View/Manage rerun only this card"""
+        with st.expander(f"{drive['company']} - {drive['date']} ({days_until} days)", expanded=False):
+            col1, col2 = st.columns(2)
+
+            with col1:
+                st.write("**Drive Details:**")
+                st.write(f"**ID:** {drive['drive_id']}")
+                st.write(f"**Mode:** {drive['mode']}")
+                st.write(f"**Venue:** {drive['venue']}")
+                st.write(f"**Time:** {drive.get('time', '10:00')}")
+
+            with col2:
+                st.write("**Registration:**")
+                st.write(f"**Deadline:** {drive.get('registration_deadline', 'N/A')}")
+                st.write(f"**Registered:** {drive['registered']}/{drive.get('expected_students', 150)}")
+                st.write(f"**Vacancies:** {drive.get('vacancies', 10)}")
+                st.write(f"**Status:** {drive['status']}")
+
+            # Action buttons
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                if st.button("👥 View Registrations", key=f"view_{drive['drive_id']}", width='stretch'):
+                    st.info(f"Showing registrations for {drive['company']} drive")
+
+            with col2:
+                if st.button("📝 Manage", key=f"manage_{drive['drive_id']}", width='stretch'):
+                    st.info(f"Managing {drive['company']} drive")
+
+            with col3:
+                if drive['status'] == 'Scheduled' and st.button("✅ Mark Complete", key=f"complete_{drive['drive_id']}", width='stretch'):
+                    self.college_data["drives"].loc[
+                        self.college_data["drives"]["drive_id"] == drive['drive_id'], 
+                        'status'
+                    ] = 'Completed'
+                    st.success(f"Drive marked as completed!")
+                    st.rerun()
+    
     def step5_student_company_matching(self):
         """Step 5: Student-Company Matching"""
         st.info("AI-powered matching of students with suitable companies")
@@ -1594,15 +1631,7 @@ class CollegeFlow:
             # Year-over-Year Comparison
             st.subheader("📅 Year-over-Year Comparison")
             
-            years = [2021, 2022, 2023, 2024]
-            placement_rates = [65, 72, 78, 82]
-            avg_packages = [10.5, 12.2, 14.5, 16.8]
-            
-            comparison_data = pd.DataFrame({
-                'Year': years,
-                'Placement Rate': placement_rates,
-                'Avg Package': avg_packages
-            })
+            comparison_data = sample_year_comparison()
             
             fig1 = px.line(comparison_data, x='Year', y=['Placement Rate', 'Avg Package'],
                           title="Year-over-Year Performance",
@@ -1646,16 +1675,7 @@ class CollegeFlow:
             # Performance Summary
             st.subheader("📊 Performance Summary")
             
-            summary_data = {
-                'Metric': ['Placement Rate', 'Avg Package', 'Highest Package', 
-                          'Internship Rate', 'Multiple Offers', 'Dream Offers'],
-                'Current': [82, 16.8, 42.5, 15, 8, 12],
-                'Target': [85, 18.0, 50.0, 20, 10, 15],
-                'Trend': ['↗️', '↗️', '↗️', '→', '↗️', '↗️']
-            }
-            
-            summary_df = pd.DataFrame(summary_data)
-            st.dataframe(summary_df, use_container_width=True)
+            st.dataframe(sample_performance_summary(), use_container_width=True)
         
         with tab2:
             st.subheader("Department-wise Performance Reports")
@@ -1840,14 +1860,10 @@ class CollegeFlow:
         
         with col1:
             if current_step > 1 and st.button("⬅️ Previous Step", width='stretch'):
-                from modules.workflow_manager import WorkflowManager
-                workflow = WorkflowManager()
-                workflow.workflows["college"]["current_step"] = current_step - 1
+                st.session_state.current_step_college = current_step - 1
                 st.rerun()
         
         with col3:
-            if current_step < 8 and st.button("Next Step ➡️", width='stretch'):
-                from modules.workflow_manager import WorkflowManager
-                workflow = WorkflowManager()
-                workflow.workflows["college"]["current_step"] = current_step + 1
+            if current_step < len(self.STEPS) and st.button("Next Step ➡️", width='stretch'):
+                st.session_state.current_step_college = current_step + 1
                 st.rerun()
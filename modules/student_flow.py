@@ -1,9 +1,37 @@
 import streamlit as st
-import pandas as pd
-import plotly.express as px
 from datetime import datetime
 
+INTERVIEW_QUESTIONS = (
+    "Tell me about yourself",
+    "Why do you want to work here?",
+    "What are your strengths and weaknesses?",
+    "Explain a challenging project you worked on",
+)
+
+FINAL_RECOMMENDATIONS = (
+    "Continue skill development",
+    "Network with professionals",
+    "Prepare for interviews",
+    "Stay updated with industry trends",
+)
+# Joined once so the list renders as a single element
+FINAL_RECOMMENDATIONS_MD = "\n".join(
+    f"{i}. ✅ {item}" for i, item in enumerate(FINAL_RECOMMENDATIONS, 1)
+)
+
 class StudentFlow:
+    # (step name, render method) in workflow order
+    STEPS = (
+        ("🎯 Profile Creation", "step1_profile_creation"),
+        ("📝 AI Resume Building", "step2_resume_building"),
+        ("📚 NEP Course Planning", "step3_course_planning"),
+        ("💼 PM Internship Match", "step4_internship_matching"),
+        ("🎯 Career Path Planning", "step5_career_planning"),
+        ("📊 Placement Prediction", "step6_placement_prediction"),
+        ("🤝 Interview Preparation", "step7_interview_preparation"),
+        ("✅ Placement Tracking", "step8_placement_tracking"),
+    )
+    
     def __init__(self):
         self.student_data = self.initialize_student_data()
         self.current_step = 1  # Initialize with default step
@@ -29,44 +57,20 @@ class StudentFlow:
         current_step = st.session_state.get('current_step_student', 1)
         self.current_step = current_step
         
-        # Display step header
-        step_names = {
-            1: "🎯 Profile Creation",
-            2: "📝 AI Resume Building", 
-            3: "📚 NEP Course Planning",
-            4: "💼 PM Internship Match",
-            5: "🎯 Career Path Planning",
-            6: "📊 Placement Prediction",
-            7: "🤝 Interview Preparation",
-            8: "✅ Placement Tracking"
-        }
+        step_name, render = self.STEPS[current_step - 1]
+        total_steps = len(self.STEPS)
         
         # Create a progress header
         col1, col2 = st.columns([3, 1])
         with col1:
-            st.subheader(f"Step {current_step}: {step_names[current_step]}")
+            st.subheader(f"Step {current_step}: {step_name}")
         with col2:
-            progress = current_step / 8
+            progress = current_step / total_steps
             st.progress(progress)
-            st.caption(f"Step {current_step} of 8")
+            st.caption(f"Step {current_step} of {total_steps}")
         
         # Display appropriate step
-        if current_step == 1:
-            self.step1_profile_creation()
-        elif current_step == 2:
-            self.step2_resume_building()
-        elif current_step == 3:
-            self.step3_course_planning()
-        elif current_step == 4:
-            self.step4_internship_matching()
-        elif current_step == 5:
-            self.step5_career_planning()
-        elif current_step == 6:
-            self.step6_placement_prediction()
-        elif current_step == 7:
-            self.step7_interview_preparation()
-        elif current_step == 8:
-            self.step8_placement_tracking()
+        getattr(self, render)()
         
         # Display navigation at the bottom
         self.display_workflow_navigation(current_step)
@@ -321,23 +325,21 @@ class StudentFlow:
         
         st.write("**Common Interview Questions:**")
         
-        questions = [
-            "Tell me about yourself",
-            "Why do you want to work here?",
-            "What are your strengths and weaknesses?",
-            "Explain a challenging project you worked on"
-        ]
-        
-        for q in questions:
-            with st.expander(f"❓ {q}"):
-                answer = st.text_area("Your Answer", key=f"answer_{q}", height=100)
-                if st.button("Get AI Feedback", key=f"feedback_{q}", width='stretch'):
-                    st.info("""
-                    **AI Feedback:**
-                    - Structure your answer clearly
-                    - Provide specific examples
-                    - Connect to the company's values
-                    """)
+        for q in INTERVIEW_QUESTIONS:
+            self.interview_question(q)
+    
+    @st.fragment
+    def interview_question(self, q):
+        """Practice panel for one question; its widgets rerun only this fragment"""
+        with st.expander(f"❓ {q}"):
+            answer = st.text_area("Your Answer", key=f"answer_{q}", height=100)
+            if st.button("Get AI Feedback", key=f"feedback_{q}", width='stretch'):
+                st.info("""
+                **AI Feedback:**
+                - Structure your answer clearly
+                - Provide specific examples
+                - Connect to the company's values
+                """)
     
     def step8_placement_tracking(self):
         """Step 8: Placement Tracking"""
@@ -354,10 +356,7 @@ class StudentFlow:
         
         # Final recommendations
         st.subheader("🎯 Final Recommendations")
-        st.write("1. ✅ Continue skill development")
-        st.write("2. ✅ Network with professionals")
-        st.write("3. ✅ Prepare for interviews")
-        st.write("4. ✅ Stay updated with industry trends")
+        st.markdown(FINAL_RECOMMENDATIONS_MD)
         
         # Restart option
         if st.button("🔄 Start New Journey", width='stretch'):
@@ -376,6 +375,6 @@ class StudentFlow:
                 st.rerun()
         
         with col3:
-            if current_step < 8 and st.button("Next Step ➡️", width='stretch'):
+            if current_step < len(self.STEPS) and st.button("Next Step ➡️", width='stretch'):
                 st.session_state.current_step_student = current_step + 1
                 st.rerun()
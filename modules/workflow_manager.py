@@ -1,5 +1,4 @@
 import streamlit as st
-import pandas as pd
 
 class WorkflowManager:
     def __init__(self):
@@ -18,8 +17,7 @@ class WorkflowManager:
                     {"id": 6, "name": "📊 Placement Prediction", "status": "pending"},
                     {"id": 7, "name": "🤝 Interview Preparation", "status": "pending"},
                     {"id": 8, "name": "✅ Placement Tracking", "status": "pending"}
-                ],
-                "current_step": 1
+                ]
             },
             "college": {
                 "steps": [
@@ -31,8 +29,7 @@ class WorkflowManager:
                     {"id": 6, "name": "📝 Interview Management", "status": "pending"},
                     {"id": 7, "name": "✅ Placement Records", "status": "pending"},
                     {"id": 8, "name": "📈 Performance Reports", "status": "pending"}
-                ],
-                "current_step": 1
+                ]
             },
             "recruiter": {
                 "steps": [
@@ -44,17 +41,20 @@ class WorkflowManager:
                     {"id": 6, "name": "📊 Candidate Evaluation", "status": "pending"},
                     {"id": 7, "name": "✅ Offer Management", "status": "pending"},
                     {"id": 8, "name": "📈 Hiring Analytics", "status": "pending"}
-                ],
-                "current_step": 1
+                ]
             }
         }
     
+    def current_step(self, role):
+        """Current step of a role's flow, kept in st.session_state.current_step_<role>"""
+        return st.session_state.get(f"current_step_{role}", 1)
+    
     def display_student_workflow(self):
         """Display student workflow steps"""
         st.subheader("📋 Student Placement Journey")
         
         workflow = self.workflows["student"]
-        current_step = workflow["current_step"]
+        current_step = self.current_step("student")
         
         # Progress bar
         progress = current_step / len(workflow["steps"])
@@ -75,11 +75,11 @@ class WorkflowManager:
         col1, col2 = st.columns(2)
         with col1:
             if current_step > 1 and st.button("⬅️ Previous Step"):
-                workflow["current_step"] -= 1
+                st.session_state.current_step_student = current_step - 1
                 st.rerun()
         with col2:
             if current_step < len(workflow["steps"]) and st.button("Next Step ➡️"):
-                workflow["current_step"] += 1
+                st.session_state.current_step_student = current_step + 1
                 st.rerun()
     
     def display_college_workflow(self):
@@ -87,7 +87,7 @@ class WorkflowManager:
         st.subheader("🏫 College Placement Management")
         
         workflow = self.workflows["college"]
-        current_step = workflow["current_step"]
+        current_step = self.current_step("college")
         
         # Display as a timeline
         for step in workflow["steps"]:
@@ -101,7 +101,7 @@ class WorkflowManager:
         st.subheader("💼 Recruiter Hiring Process")
         
         workflow = self.workflows["recruiter"]
-        current_step = workflow["current_step"]
+        current_step = self.current_step("recruiter")
         
         # Visual timeline
         cols = st.columns(len(workflow["steps"]))
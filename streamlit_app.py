@@ -1,10 +1,16 @@
+import sys
 import streamlit as st
-import pandas as pd
 
 # Try to import database modules with fallbacks
 try:
     from database.db_manager import DatabaseManager
-    db_manager = DatabaseManager()
+    
+    @st.cache_resource
+    def get_db():
+        """Create the database manager once per process, shared across reruns"""
+        return DatabaseManager()
+    
+    db_manager = get_db()
     DB_AVAILABLE = True
 except Exception as e:
     st.warning(f"Database module not available: {e}. Using fallback mode.")
@@ -13,9 +19,21 @@ except Exception as e:
     DB_AVAILABLE = False
 
 from modules.workflow_manager import WorkflowManager
-from modules.student_flow import StudentFlow
-from modules.college_flow import CollegeFlow
-from modules.recruiter_flow import RecruiterFlow
+
+# Role labels shown in the sidebar; interned so every rerun compares and
+# hashes the same string objects
+ROLE_STUDENT = sys.intern("👨‍🎓 Student")
+ROLE_COLLEGE = sys.intern("🏫 College Admin")
+ROLE_RECRUITER = sys.intern("💼 Recruiter")
+ROLE_OBSERVER = sys.intern("👀 Observer")
+_ROLE_OPTIONS = (ROLE_STUDENT, ROLE_COLLEGE, ROLE_RECRUITER, ROLE_OBSERVER)
+
+_FOOTER_HTML = """
+<div style="text-align: center">
+    <p>🎓 <b>AI Campus Placement Platform</b> | National Level Hackathon Project</p>
+    <p>Built with ❤️ using Streamlit & Python</p>
+</div>
+"""
 
 # Page configuration
 st.set_page_config(
@@ -29,14 +47,13 @@ st.set_page_config(
 if 'workflow_manager' not in st.session_state:
     st.session_state.workflow_manager = WorkflowManager()
 
-if 'student_flow' not in st.session_state:
-    st.session_state.student_flow = StudentFlow()
-
-if 'college_flow' not in st.session_state:
-    st.session_state.college_flow = CollegeFlow()
-
-if 'recruiter_flow' not in st.session_state:
-    st.session_state.recruiter_flow = RecruiterFlow()
+workflow_manager = st.session_state.workflow_manager
+WORKFLOW_DISPATCH = {
+    ROLE_STUDENT: workflow_manager.display_student_workflow,
+    ROLE_COLLEGE: workflow_manager.display_college_workflow,
+    ROLE_RECRUITER: workflow_manager.display_recruiter_workflow,
+    ROLE_OBSERVER: workflow_manager.display_observer_dashboard,
+}
 
 if 'selected_role' not in st.session_state:
     st.session_state.selected_role = None
@@ -51,6 +68,12 @@ st.markdown("""
 **A Systematic End-to-End Placement Management Platform**
 """)
 
+# Report a schema created or upgraded by this process, once per session
+if (DB_AVAILABLE and db_manager.schema_initialized
+        and not st.session_state.get('schema_notice_shown')):
+    st.success("Database initialized successfully!")
+    st.session_state.schema_notice_shown = True
+
 # Show warning if database not available
 if not DB_AVAILABLE:
     st.warning("""
@@ -71,50 +94,55 @@ with st.sidebar:
     
     role = st.radio(
         "Choose your role:",
-        ["👨‍🎓 Student", "🏫 College Admin", "💼 Recruiter", "👀 Observer"],
+        _ROLE_OPTIONS,
         key="role_selection",
         label_visibility="collapsed"
     )
     
-    # Store selected role
-    if role != st.session_state.get('selected_role'):
-        st.session_state.selected_role = role
-        st.rerun()
+    # Store selected role; the radio change already triggered this run
+    st.session_state.selected_role = role
     
     st.divider()
     
     # Show workflow based on selected role
-    if st.session_state.selected_role == "👨‍🎓 Student":
-        st.session_state.workflow_manager.display_student_workflow()
-    elif st.session_state.selected_role == "🏫 College Admin":
-        st.session_state.workflow_manager.display_college_workflow()
-    elif st.session_state.selected_role == "💼 Recruiter":
-        st.session_state.workflow_manager.display_recruiter_workflow()
-    else:
-        st.session_state.workflow_manager.display_observer_dashboard()
-
-# Main content
-if st.session_state.selected_role == "👨‍🎓 Student":
+    WORKFLOW_DISPATCH.get(role, workflow_manager.display_observer_dashboard)()
+
+# Main content - role flows are imported and created on first use, so a
+# session only pays for the modules its selected role needs
+def _render_student():
+    from modules.student_flow import StudentFlow
+    if 'student_flow' not in st.session_state:
+        st.session_state.student_flow = StudentFlow()
     current_step = st.session_state.get('current_step_student', 1)
     st.session_state.student_flow.current_step = current_step
     st.session_state.student_flow.display()
-    
-elif st.session_state.selected_role == "🏫 College Admin":
+
+def _render_college():
+    from modules.college_flow import CollegeFlow
+    if 'college_flow' not in st.session_state:
+        st.session_state.college_flow = CollegeFlow()
     current_step = st.session_state.get('current_step_college', 1)
     st.session_state.college_flow.current_step = current_step
     st.session_state.college_flow.display()
-    
-elif st.session_state.selected_role == "💼 Recruiter":
+
+def _render_recruiter():
+    from modules.recruiter_flow import RecruiterFlow
+    if 'recruiter_flow' not in st.session_state:
+        st.session_state.recruiter_flow = RecruiterFlow()
     st.session_state.recruiter_flow.display()
-    
-else:
-    st.session_state.workflow_manager.display_observer_view()
+
+def _render_observer():
+    workflow_manager.display_observer_view()
+
+ROLE_HANDLERS = {
+    ROLE_STUDENT: _render_student,
+    ROLE_COLLEGE: _render_college,
+    ROLE_RECRUITER: _render_recruiter,
+    ROLE_OBSERVER: _render_observer,
+}
+
+ROLE_HANDLERS.get(st.session_state.selected_role, _render_observer)()
 
 # Footer
 st.divider()
-st.markdown("""
-<div style="text-align: center">
-    <p>🎓 <b>AI Campus Placement Platform</b> | National Level Hackathon Project</p>
-    <p>Built with ❤️ using Streamlit & Python</p>
-</div>
-""", unsafe_allow_html=True)
+st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
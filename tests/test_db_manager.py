@@ -0,0 +1,241 @@
+import sqlite3
+import threading
+
+import pytest
+
+from database.db_manager import SCHEMA_VERSION, DatabaseManager, is_bcrypt_hash
+
+# Tables as the first release created them, before any schema upgrade
+LEGACY_SCHEMA = '''
+CREATE TABLE users (
+    user_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    username TEXT UNIQUE NOT NULL,
+    email TEXT UNIQUE NOT NULL,
+    password_hash TEXT NOT NULL,
+    role TEXT NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    is_active BOOLEAN DEFAULT 1
+);
+CREATE TABLE students (
+    student_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER UNIQUE,
+    full_name TEXT NOT NULL,
+    enrollment_number TEXT UNIQUE,
+    college_id INTEGER,
+    department TEXT,
+    semester INTEGER,
+    cgpa REAL,
+    phone TEXT,
+    skills TEXT,
+    resume_path TEXT,
+    profile_pic_path TEXT,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE
+);
+CREATE TABLE colleges (
+    college_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id INTEGER UNIQUE,
+    college_name TEXT UNIQUE NOT NULL,
+    FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE CASCADE
+);
+CREATE TABLE applications (
+    application_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    student_id INTEGER,
+    job_id INTEGER,
+    application_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    status TEXT DEFAULT 'pending',
+    cover_letter TEXT,
+    resume_path TEXT,
+    feedback TEXT,
+    FOREIGN KEY (student_id) REFERENCES students(student_id) ON DELETE CASCADE,
+    UNIQUE(student_id, job_id)
+);
+CREATE INDEX idx_applications_student ON applications(student_id);
+CREATE TABLE interview_feedback (
+    feedback_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    application_id INTEGER,
+    interviewer_id INTEGER,
+    overall_rating INTEGER,
+    strengths TEXT,
+    areas_for_improvement TEXT,
+    recommendation TEXT,
+    feedback_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    FOREIGN KEY (application_id) REFERENCES applications(application_id) ON DELETE CASCADE
+);
+CREATE TABLE student_skills (
+    skill_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    student_id INTEGER,
+    skill_name TEXT NOT NULL,
+    proficiency_level INTEGER,
+    certification TEXT,
+    verified BOOLEAN DEFAULT 0,
+    FOREIGN KEY (student_id) REFERENCES students(student_id) ON DELETE CASCADE
+);
+CREATE TABLE nep_compliance (
+    compliance_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    college_id INTEGER,
+    year INTEGER,
+    multidisciplinary_score INTEGER,
+    flexible_curriculum_score INTEGER,
+    skill_integration_score INTEGER,
+    digital_literacy_score INTEGER,
+    research_culture_score INTEGER,
+    industry_connect_score INTEGER,
+    overall_score REAL,
+    FOREIGN KEY (college_id) REFERENCES colleges(college_id) ON DELETE CASCADE
+);
+CREATE TABLE blockchain_credentials (
+    credential_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    student_id INTEGER,
+    credential_type TEXT NOT NULL,
+    credential_hash TEXT UNIQUE NOT NULL,
+    issuer TEXT,
+    issue_date DATE,
+    expiration_date DATE,
+    verified BOOLEAN DEFAULT 0,
+    blockchain_tx_id TEXT,
+    metadata TEXT,
+    FOREIGN KEY (student_id) REFERENCES students(student_id) ON DELETE CASCADE
+);
+'''
+
+
+@pytest.fixture
+def legacy_db(tmp_path):
+    """A first-release database where student 2 was deleted, leaving
+    orphaned rows behind (foreign keys were never enforced)"""
+    path = str(tmp_path / "legacy.db")
+    conn = sqlite3.connect(path)
+    conn.executescript(LEGACY_SCHEMA)
+    conn.executescript('''
+        INSERT INTO users (user_id, username, email, password_hash, role)
+        VALUES (1, 'student1', 's1@demo.com', 'password123', 'student'),
+               (2, 'college1', 'c1@demo.com', 'password123', 'college_admin');
+        INSERT INTO students (student_id, user_id, full_name, skills)
+        VALUES (1, 1, 'Student One', 'Python, SQL');
+        INSERT INTO colleges (college_id, user_id, college_name) VALUES (1, 2, 'College One');
+        INSERT INTO student_skills (student_id, skill_name) VALUES (1, 'Python'), (2, 'Java');
+        INSERT INTO nep_compliance (college_id, year, multidisciplinary_score)
+        VALUES (1, 2024, 6), (7, 2024, 5);
+        INSERT INTO applications (application_id, student_id, job_id, cover_letter)
+        VALUES (1, 1, NULL, 'Dear hiring team');
+        INSERT INTO interview_feedback (feedback_id, application_id, strengths)
+        VALUES (1, 1, 'Clear communicator');
+        INSERT INTO blockchain_credentials (student_id, credential_type, credential_hash)
+        VALUES (1, 'degree', 'ab12'), (1, 'award', 'not-hex'), (2, 'degree', 'cd34');
+    ''')
+    conn.commit()
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def db(legacy_db):
+    manager = DatabaseManager(legacy_db)
+    yield manager
+    manager.close_all_connections()
+
+
+def test_upgrade_skips_orphaned_rows(db):
+    with db.cursor() as cursor:
+        assert cursor.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+        assert cursor.execute("PRAGMA foreign_key_check").fetchall() == []
+        skills = cursor.execute("SELECT student_id, skill_name FROM student_skills").fetchall()
+        assert sorted(map(tuple, skills)) == [(1, 'Python'), (1, 'SQL')]
+        assert [row[0] for row in cursor.execute("SELECT college_id FROM nep_compliance")] == [1]
+        assert [row[0] for row in cursor.execute(
+            "SELECT student_id FROM blockchain_credentials")] == [1, 1]
+
+
+def test_upgraded_database_accepts_writes(db):
+    assert db.save_nep_compliance_score(1, 2024, {'multidisciplinary': 8})
+    recruiter_id = db._write(lambda cursor: cursor.execute(
+        "INSERT INTO recruiters (company_name) VALUES ('Acme') RETURNING recruiter_id"
+    ).fetchone()[0])
+    job_id = db.create_job(recruiter_id, {
+        'title': 'Engineer', 'description': '', 'location': 'Pune',
+        'job_type': 'full_time', 'skills_required': 'Python'
+    })
+    assert job_id is not None
+    assert db.create_application(1, job_id) is not None
+    assert list(db.get_jobs({'skills': 'python'})['job_id']) == [job_id]
+
+
+def test_upgrade_moves_prose_to_side_tables(db):
+    with db.cursor() as cursor:
+        names = {row[1] for row in cursor.execute("PRAGMA table_info(applications)")}
+        assert not names & {'cover_letter', 'resume_path', 'feedback'}
+        names = {row[1] for row in cursor.execute("PRAGMA table_info(interview_feedback)")}
+        assert not names & {'strengths', 'areas_for_improvement'}
+        notes = cursor.execute("SELECT strengths FROM interview_feedback_notes").fetchone()
+        assert notes[0] == 'Clear communicator'
+    assert db.get_application_details(1)['cover_letter'] == 'Dear hiring team'
+    assert 'cover_letter' not in db.get_student_applications(1).columns
+
+
+def test_credential_hashes(db):
+    assert db.get_credential_by_hash('AB12')['credential_type'] == 'degree'
+    assert db.get_credential_by_hash('not-hex')['credential_type'] == 'award'
+    
+    digest = bytes(range(32))
+    credential_id = db.create_blockchain_credential(
+        1, 'certificate', digest.hex(), blockchain_tx_id='0x' + 'ff' * 32
+    )
+    credential = db.get_credential_by_hash(digest)
+    assert credential['credential_id'] == credential_id
+    assert credential['blockchain_tx_id'] == b'\xff' * 32
+    assert db.create_blockchain_credential(
+        1, 'certificate', 'ee' * 32, blockchain_tx_id='pending'
+    ) is not None
+
+
+def test_read_connections_are_reused_across_threads(db):
+    # Streamlit runs every rerun on a new thread
+    connections = []
+    
+    def read():
+        with db.cursor() as cursor:
+            cursor.execute("SELECT COUNT(*) FROM users").fetchone()
+            connections.append(cursor.connection)
+    
+    for _ in range(3):
+        thread = threading.Thread(target=read)
+        thread.start()
+        thread.join()
+    assert len(set(map(id, connections))) == 1
+
+
+def test_upgrade_drops_redundant_indexes(db):
+    with db.cursor() as cursor:
+        names = {row[0] for row in cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {'idx_apps_student_date', 'idx_notif_user_read_date'} <= names
+    assert not names & {'idx_applications_student', 'idx_notifications_user'}
+
+
+@pytest.mark.parametrize('password', ['password123', '$2secret'])
+def test_plain_text_password_is_rehashed_on_login(db, password):
+    db._write(lambda cursor: cursor.execute(
+        "UPDATE users SET password_hash = ? WHERE username = 'student1'", (password,)
+    ))
+    assert db.authenticate_user('student1', 'wrong') is None
+    
+    user = db.authenticate_user('student1', password)
+    assert user is not None and is_bcrypt_hash(user['password_hash'])
+    with db.cursor() as cursor:
+        stored = cursor.execute(
+            "SELECT password_hash FROM users WHERE username = 'student1'").fetchone()[0]
+    assert stored == user['password_hash']
+    assert db.authenticate_user('student1', password) is not None
+
+
+def test_flush_keeps_valid_notifications_when_one_fails(db):
+    assert db.create_notification(1, 'Welcome', 'Profile created')
+    assert db.create_notification(999, 'Lost', 'No such user')
+    
+    assert db.flush_notifications() is False
+    notifications = db.get_user_notifications(1)
+    assert list(notifications['title']) == ['Welcome']
+    with db.cursor() as cursor:
+        assert cursor.execute(
+            "SELECT COUNT(*) FROM notifications WHERE user_id = 999").fetchone()[0] == 0